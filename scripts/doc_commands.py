@@ -4,37 +4,78 @@ Extract command name + description pairs from Lektra::initCommands().
 Usage: python extract_commands.py <source_file>
 """
 
+import mmap
 import re
 import sys
 import json
 import os
+from collections.abc import Iterator
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 HOME = os.getenv("HOME")
 
+# Match m_command_manager->reg("name", "description", ...)
+COMMAND_PATTERN = re.compile(
+    rb'm_command_manager->reg\(\s*"([^"]+)"\s*,\s*(?:tr\()?\"([^\"]*)\"\)?\s*,',
+    re.MULTILINE,
+)
+
+# Literal prefix of COMMAND_PATTERN, used to locate candidates with Hyperscan.
+COMMAND_PREFIX = rb"m_command_manager->reg\("
+
+
+def _hyperscan_starts(buf) -> list[int]:
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(expressions=[COMMAND_PREFIX], flags=[hyperscan.HS_FLAG_SOM_LEFTMOST])
+
+    starts = []
+
+    def on_match(_id, start, _end, _flags, _ctx):
+        starts.append(start)
+
+    db.scan(buf, match_event_handler=on_match)
+    return starts
+
 
-def extract_commands(path: str) -> list[tuple[str, str]]:
-    with open(path, "r") as f:
-        source = f.read()
+def extract_commands(path: str) -> Iterator[tuple[str, str]]:
+    # Scan the mapped file directly instead of reading it into a string first.
+    with open(path, "rb") as f:
+        # An empty file cannot be mapped, and has no commands anyway.
+        if os.fstat(f.fileno()).st_size == 0:
+            return
 
-    # Match m_command_manager.reg("name", "description", ...)
-    pattern = re.compile(
-        r'm_command_manager->reg\(\s*"([^"]+)"\s*,\s*(?:tr\()?\"([^\"]*)\"\)?\s*,',
-        re.MULTILINE,
-    )
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hyperscan is None:
+                matches = COMMAND_PATTERN.finditer(mm)
+            else:
+                # Hyperscan finds candidate offsets but has no capture groups,
+                # so the groups are extracted by anchoring the regex at each
+                # offset.
+                matches = (
+                    COMMAND_PATTERN.match(mm, pos) for pos in _hyperscan_starts(mm)
+                )
 
-    return pattern.findall(source)
+            for m in matches:
+                if m is not None:
+                    yield m.group(1).decode(), m.group(2).decode()
 
 
 def main():
     path = sys.argv[1] if len(sys.argv) > 1 else "../src/Lektra.cpp"
 
-    commands = extract_commands(path)
+    out = [
+        {"name": name, "description": desc}
+        for name, desc in extract_commands(path)
+    ]
 
-    if not commands:
+    if not out:
         print("No commands found.")
         return
 
-    out = [{"name": name, "description": desc} for name, desc in commands]
     with open(
         f"{HOME}/Gits/dheerajshenoy.github.io/lektra/files/commands.json", "w"
     ) as f:
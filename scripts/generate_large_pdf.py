@@ -4,7 +4,7 @@ Generate a huge PDF (e.g., 10k pages) to stress-test PDF viewers.
 Includes optional heavy vector figures and raster images for benchmarking.
 
 Requires:
-  pip install reportlab
+  pip install reportlab numpy
   pip install pillow  # only if images are enabled (default)
 
 Examples:
@@ -12,19 +12,32 @@ Examples:
   python gen_big_pdf.py out.pdf --pages 10000 --font-size 10 --with-rects --vary-sizes
   python gen_big_pdf.py out.pdf --pages 2000 --image-px 2200 --images-per-page 3
   python gen_big_pdf.py out.pdf --pages 2000 --fast
+  python gen_big_pdf.py out.pdf --pages 10000 --jobs 8  # needs: pip install pikepdf
 """
 
 import argparse
 import math
+import multiprocessing
+import os
 import random
+import tempfile
+import zlib
+from bisect import bisect_right
+from collections.abc import Sequence
+from contextlib import ExitStack, suppress
 from dataclasses import dataclass
 from functools import lru_cache
 from io import BytesIO
+from itertools import accumulate
 
+import numpy as np
 from reportlab.lib.pagesizes import A4, LETTER, landscape
+from reportlab.lib.rl_accel import fp_str
 from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfdoc
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
 
 LOREM = (
     "Lorem ipsum dolor sit amet, consectetur adipiscing elit. "
@@ -37,25 +50,25 @@ LOREM = (
 )
 
 
-def wrap_lines(text: str, max_chars: int):
-    words = text.split()
-    line = []
-    n = 0
-    for w in words:
-        add = len(w) + (1 if line else 0)
-        if n + add > max_chars:
-            yield " ".join(line)
-            line = [w]
-            n = len(w)
-        else:
-            if line:
-                line.append(w)
-                n += add
-            else:
-                line = [w]
-                n = len(w)
-    if line:
-        yield " ".join(line)
+# Body text is static, so it is tokenized once at import.
+_LOREM_WORDS = tuple((LOREM * 6).split())
+
+
+def wrap_lines(words: Sequence[str], max_chars: int):
+    # prefix[k] is the length of words[:k], each followed by one space, so the
+    # greedy break for a line is a binary search instead of a word-by-word walk.
+    prefix = [0, *accumulate(len(w) + 1 for w in words)]
+    start = 0
+    while start < len(words):
+        end = bisect_right(prefix, prefix[start] + max_chars + 1) - 1
+        end = max(end, start + 1)
+        yield " ".join(words[start:end])
+        start = end
+
+
+@lru_cache(maxsize=16)
+def _wrapped_lorem(max_chars: int):
+    return list(wrap_lines(_LOREM_WORDS, max_chars))
 
 
 def page_size_for(i: int, vary: bool):
@@ -72,6 +85,14 @@ def page_size_for(i: int, vary: bool):
     return landscape(LETTER)
 
 
+@dataclass(frozen=True)
+class FontConfig:
+    name: str
+    title_size: int
+    body_size: int
+    caption_size: int
+
+
 @dataclass(frozen=True)
 class ImageConfig:
     enabled: bool
@@ -80,6 +101,30 @@ class ImageConfig:
     variants: int
     seed: int
     fast: bool
+    cache_dir: str | None
+
+
+def _set_font(c: canvas.Canvas, name: str, size: int):
+    # The canvas tracks the active font (and resets it per page); skip the
+    # Tf operator when nothing would change.
+    if c._fontname != name or c._fontsize != size:
+        c.setFont(name, size)
+
+
+class _LeveledZCompress(pdfdoc.PDFStreamFilterZCompress):
+    def __init__(self, level: int):
+        self.level = level
+
+    def encode(self, text):
+        if isinstance(text, str):
+            text = text.encode("utf8")
+        return zlib.compress(text, self.level)
+
+
+def _set_compress_level(level: int):
+    # ReportLab always deflates at zlib's default level 6 through this shared
+    # filter instance, which it looks up when each stream is written.
+    pdfdoc.PDFZCompress = _LeveledZCompress(level)
 
 
 def _require_pillow():
@@ -92,64 +137,182 @@ def _require_pillow():
         ) from exc
 
 
-@lru_cache(maxsize=8)
-def _make_image_reader(px: int, variant: int, seed: int) -> ImageReader:
+def _require_pikepdf():
+    try:
+        import pikepdf  # noqa: F401
+    except Exception as exc:
+        raise SystemExit(
+            "pikepdf is required for --jobs greater than 1. "
+            "Install it with: pip install pikepdf"
+        ) from exc
+
+
+# Bump when the image generation or encoding changes to invalidate old cache files.
+IMAGE_CACHE_VERSION = 1
+
+
+def _default_cache_dir() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "lektra-bigpdf")
+
+
+def _np_seed(seed: int) -> int:
+    # numpy's seeding rejects negative ints, while --seed accepts any int.
+    return seed & 0xFFFF_FFFF_FFFF_FFFF
+
+
+def _render_image(px: int, variant: int, seed: int) -> bytes:
     # Generate a heavy raster image (noise + shapes) to stress decoding.
     from PIL import Image, ImageDraw, ImageFilter
 
-    rng = random.Random(seed + variant * 10007)
-    img = Image.effect_noise((px, px), rng.uniform(30.0, 90.0)).convert("RGB")
+    rng = np.random.default_rng(_np_seed(seed + variant * 10007))
+    noise = rng.integers(0, 256, (px, px, 3), dtype=np.uint8)
+    img = Image.fromarray(noise, "RGB")
+
+    # Add colorful shapes to avoid trivial compression. All randomness is drawn
+    # up front so the loop below only issues the draw calls.
+    n_shapes = 120
+    x0 = rng.integers(0, px, n_shapes)
+    y0 = rng.integers(0, px, n_shapes)
+    x_end = np.minimum(px, x0 + rng.integers(20, px // 2, n_shapes, endpoint=True))
+    y_end = np.minimum(px, y0 + rng.integers(20, px // 2, n_shapes, endpoint=True))
+    x1 = x0 + (rng.random(n_shapes) * (x_end - x0 + 1)).astype(np.int64)
+    y1 = y0 + (rng.random(n_shapes) * (y_end - y0 + 1)).astype(np.int64)
+    boxes = np.stack([x0, y0, x1, y1], axis=1).tolist()
+    colors = rng.integers(0, 256, (n_shapes, 3)).tolist()
+    is_rect = (rng.random(n_shapes) < 0.5).tolist()
 
-    # Add colorful shapes to avoid trivial compression.
     draw = ImageDraw.Draw(img)
-    for _ in range(120):
-        x0 = rng.randint(0, px - 1)
-        y0 = rng.randint(0, px - 1)
-        x1 = rng.randint(x0, min(px, x0 + rng.randint(20, px // 2)))
-        y1 = rng.randint(y0, min(px, y0 + rng.randint(20, px // 2)))
-        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
-        if rng.random() < 0.5:
-            draw.rectangle([x0, y0, x1, y1], outline=color, fill=None)
-        else:
-            draw.ellipse([x0, y0, x1, y1], outline=color, fill=None)
+    for box, color, rect in zip(boxes, colors, is_rect):
+        shape = draw.rectangle if rect else draw.ellipse
+        shape(box, outline=tuple(color), fill=None)
 
     img = img.filter(ImageFilter.GaussianBlur(radius=rng.uniform(0.5, 1.5)))
 
     bio = BytesIO()
-    img.save(bio, format="PNG", optimize=False)
-    bio.seek(0)
-    return ImageReader(bio)
+    # JPEG data is embedded as-is (DCTDecode); PNG would be decoded and
+    # re-deflated by ReportLab.
+    img.save(bio, format="JPEG", quality=80, optimize=False, progressive=False)
+    return bio.getvalue()
+
+
+def _read_cached_image(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        print(f"Warning: could not read image cache {path}: {exc}")
+        return None
+
+    # A truncated or corrupt file would otherwise fail inside ReportLab on
+    # every later run; decode it fully and let the caller regenerate it.
+    from PIL import Image
+
+    try:
+        with Image.open(BytesIO(data)) as im:
+            im.load()
+    except (OSError, SyntaxError, ValueError) as exc:
+        print(f"Warning: regenerating corrupt image cache {path}: {exc}")
+        return None
+    return data
+
+
+@lru_cache(maxsize=8)
+def _make_image_reader(
+    px: int, variant: int, seed: int, cache_dir: str | None
+) -> ImageReader:
+    # Encoded images are cached on disk so reruns and --jobs workers skip the
+    # expensive generation.
+    path = None
+    if cache_dir is not None:
+        name = f"v{IMAGE_CACHE_VERSION}_{px}_{variant}_{seed}.jpg"
+        path = os.path.join(cache_dir, name)
+        data = _read_cached_image(path)
+        if data is not None:
+            return ImageReader(BytesIO(data))
+
+    data = _render_image(px, variant, seed)
+    if path is not None:
+        tmp_name = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename so concurrent workers never see partial files.
+            with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(data)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            if tmp_name is not None:
+                with suppress(OSError):
+                    os.unlink(tmp_name)
+            print(f"Warning: could not write image cache {path}: {exc}")
+    return ImageReader(BytesIO(data))
+
+
+def draw_image_variant(
+    c: canvas.Canvas,
+    img_cfg: ImageConfig,
+    variant: int,
+    x: float,
+    y: float,
+    draw_w: float,
+    draw_h: float,
+):
+    # drawImage digests the full pixel data on every call to find an already
+    # embedded copy. Wrapping each variant in a unit-square form pays for that
+    # once per document; pages then only scale and reference the form.
+    name = f"img_{img_cfg.px}_{variant}_{img_cfg.seed}"
+    if not c.hasForm(name):
+        img = _make_image_reader(img_cfg.px, variant, img_cfg.seed, img_cfg.cache_dir)
+        c.beginForm(name, upperx=1, uppery=1)
+        c.drawImage(img, 0, 0, 1, 1, mask=None)
+        c.endForm()
+    c.saveState()
+    c.translate(x, y)
+    c.scale(draw_w, draw_h)
+    c.doForm(name)
+    c.restoreState()
+
+
+# Distinct heavy figure colorings rotated across pages.
+FIGURE_VARIANTS = 4
 
 
 @lru_cache(maxsize=8)
 def _figure_variants(w: float, h: float, complexity: int, variants: int, seed: int):
-    # Precompute heavy figure points for speed; reused across pages.
+    # Precompute heavy figure segments for speed; reused across pages.
     data = []
     cx, cy = w * 0.5, h * 0.55
     radius = min(w, h) * 0.38
     step = max(6.0, min(w, h) / 80.0)
-    grid = []
-    y = h * 0.15
-    while y < h * 0.45:
-        x = w * 0.1
-        while x < w * 0.9:
-            grid.append((x, y))
-            x += step
-        y += step
+    # Stop a hair early so rounding never adds a row/column on the boundary.
+    eps = step * 1e-9
+    gx, gy = np.meshgrid(
+        np.arange(w * 0.1, w * 0.9 - eps, step),
+        np.arange(h * 0.15, h * 0.45 - eps, step),
+    )
+    # All grid circles go into one path so they are stroked once.
+    grid_path = PDFPathObject()
+    for x, y in zip(gx.ravel().tolist(), gy.ravel().tolist()):
+        grid_path.circle(x, y, step * 0.35)
+    # The curves only depend on the page size, so every variant shares them
+    # and just picks its own colors.
+    a = (2 * math.pi * np.arange(complexity)) / complexity
+    k = np.arange(4)[:, None]
+    r = radius * (0.35 + 0.65 * np.sin(a * (k + 2)))
+    xs = cx + r * np.cos(a * (k + 1))
+    ys = cy + r * np.sin(a * (k + 3))
+    segments = np.stack(
+        [xs[:, :-1], ys[:, :-1], xs[:, 1:], ys[:, 1:]], axis=2
+    ).tolist()
     for v in range(variants):
         rng = random.Random(seed + v * 137)
         colors = [(rng.random(), rng.random(), rng.random()) for _ in range(4)]
-        paths = []
-        for k in range(4):
-            pts = []
-            for t in range(complexity):
-                a = (2 * math.pi * t) / complexity
-                r = radius * (0.35 + 0.65 * math.sin(a * (k + 2)))
-                x = cx + r * math.cos(a * (k + 1))
-                y = cy + r * math.sin(a * (k + 3))
-                pts.append((x, y))
-            paths.append(pts)
-        data.append((colors, paths, step * 0.35, grid))
+        data.append((colors, segments, grid_path))
     return data
 
 
@@ -164,32 +327,50 @@ def draw_heavy_figures(
     # Dense vector shapes to stress vector rendering (cached per size).
     c.saveState()
     c.setLineWidth(0.4)
-    variants = _figure_variants(w, h, complexity, 4, seed)
-    colors, paths, grid_r, grid = variants[variant % len(variants)]
-    for color, pts in zip(colors, paths):
+    variants = _figure_variants(w, h, complexity, FIGURE_VARIANTS, seed)
+    colors, segments, grid_path = variants[variant % len(variants)]
+    for color, segs in zip(colors, segments):
         c.setStrokeColorRGB(*color)
-        for (x1, y1), (x2, y2) in zip(pts, pts[1:]):
-            c.line(x1, y1, x2, y2)
+        c.lines(segs)
 
     c.setStrokeColorRGB(0.2, 0.2, 0.2)
-    for x, y in grid:
-        c.circle(x, y, grid_r, stroke=1, fill=0)
+    c.drawPath(grid_path, stroke=1, fill=0)
     c.restoreState()
 
 
-@lru_cache(maxsize=8)
-def _rects_for_size(w: float, h: float, seed: int):
-    rng = random.Random(seed)
-    rects = []
+# Distinct rectangle layouts rotated across pages in the non-fast path.
+RECT_LAYOUTS = 64
+
+
+@lru_cache(maxsize=4 * RECT_LAYOUTS)
+def _rects_for_size(w: float, h: float, seed: int, layout: int = 0) -> str:
+    rng = np.random.default_rng((_np_seed(seed), layout))
     margin = 15 * mm
     n_rects = 80
-    for _ in range(n_rects):
-        rw = rng.uniform(5, 40) * mm
-        rh = rng.uniform(3, 25) * mm
-        rx = rng.uniform(margin, max(margin, w - margin - rw))
-        ry = rng.uniform(margin, max(margin, h - margin - rh))
-        rects.append((rx, ry, rw, rh))
-    return rects
+    rw = rng.uniform(5, 40, n_rects) * mm
+    rh = rng.uniform(3, 25, n_rects) * mm
+    rx = rng.uniform(margin, np.maximum(margin, w - margin - rw))
+    ry = rng.uniform(margin, np.maximum(margin, h - margin - rh))
+    rects = np.stack([rx, ry, rw, rh], axis=1).tolist()
+    # Pre-rendered PDF operators: every rectangle in one stroked path.
+    return "n " + " ".join(f"{fp_str(*r)} re" for r in rects) + " S"
+
+
+# Phase buckets for the per-page sine chart; pages in a bucket share a path.
+SINE_PHASES = 64
+
+
+@lru_cache(maxsize=4 * SINE_PHASES)
+def _sine_code(x: float, y: float, w: float, h: float, phase_bucket: int) -> str:
+    steps = 120
+    t = np.linspace(0.0, 2 * math.pi, steps + 1)
+    phase = phase_bucket * (2 * math.pi / SINE_PHASES)
+    px = x + (t / (2 * math.pi)) * w
+    py = y + (np.sin(t + phase) * 0.45 + 0.5) * h  # [~0.05, ~0.95]
+    # Pre-rendered PDF operators for the whole polyline, stroked once.
+    pts = np.stack([px, py], axis=1).tolist()
+    ops = [f"{fp_str(*pts[0])} m"] + [f"{fp_str(*p)} l" for p in pts[1:]]
+    return "n " + " ".join(ops) + " S"
 
 
 @lru_cache(maxsize=8)
@@ -212,39 +393,41 @@ def _image_positions(w: float, h: float, per_page: int, seed: int):
     return positions
 
 
-def draw_page(
+def _chart_box(w: float, h: float):
+    margin = 15 * mm
+    return margin, margin + 20, min(140 * mm, w - 2 * margin), 35 * mm
+
+
+def draw_page_template(
     c: canvas.Canvas,
-    i: int,
     w: float,
     h: float,
-    font_name: str,
-    font_size: int,
-    with_rects: bool,
+    font: FontConfig,
     figure_complexity: int,
-    img_cfg: ImageConfig,
+    variant: int,
+    seed: int,
 ):
+    # Everything here is identical for pages sharing a size and figure
+    # variant, so it can be recorded once as a Form XObject.
     margin = 15 * mm
     x0, y0 = margin, h - margin
 
-    c.setFont(font_name, font_size + 4)
-    c.drawString(x0, y0, f"Stress Test PDF — Page {i}")
-
-    c.setFont(font_name, font_size)
+    _set_font(c, font.name, font.body_size)
     c.drawString(
         x0,
         y0 - 18,
-        f"Page size: {w:.1f} x {h:.1f} pts    (font {font_name} {font_size}pt)",
+        f"Page size: {w:.1f} x {h:.1f} pts    (font {font.name} {font.body_size}pt)",
     )
 
     # Add a “body” of wrapped text lines
     body_top = y0 - 45
     max_chars = max(
-        40, int((w - 2 * margin) / (font_size * 0.55))
+        40, int((w - 2 * margin) / (font.body_size * 0.55))
     )  # crude but good enough
-    lines = list(wrap_lines(LOREM * 6, max_chars))
+    lines = _wrapped_lorem(max_chars)
 
     y = body_top
-    line_h = font_size * 1.25
+    line_h = font.body_size * 1.25
     for ln in lines:
         if y < margin + 60:
             break
@@ -252,66 +435,71 @@ def draw_page(
         y -= line_h
 
     # Add a simple vector “chart” so rendering isn’t just text
-    chart_x = x0
-    chart_y = margin + 20
-    chart_w = min(140 * mm, w - 2 * margin)
-    chart_h = 35 * mm
-
+    chart_x, chart_y, chart_w, chart_h = _chart_box(w, h)
     c.rect(chart_x, chart_y, chart_w, chart_h, stroke=1, fill=0)
-    # Sine-ish polyline
-    pts = []
-    steps = 120
-    for k in range(steps + 1):
-        t = (k / steps) * 2 * math.pi
-        yy = math.sin(t + i * 0.01) * 0.45 + 0.5  # [~0.05, ~0.95]
-        px = chart_x + (k / steps) * chart_w
-        py = chart_y + yy * chart_h
-        pts.append((px, py))
-    for (x1, y1), (x2, y2) in zip(pts, pts[1:]):
-        c.line(x1, y1, x2, y2)
-
-    c.setFont(font_name, max(6, font_size - 2))
+
+    _set_font(c, font.name, font.caption_size)
     c.drawString(
         chart_x, chart_y + chart_h + 6, "Vector polyline (varies slightly per page)"
     )
 
     if figure_complexity > 0:
-        draw_heavy_figures(
-            c,
-            w,
-            h,
-            figure_complexity,
-            variant=i,
-            seed=img_cfg.seed,
-        )
+        draw_heavy_figures(c, w, h, figure_complexity, variant, seed)
+
+
+def draw_page(
+    c: canvas.Canvas,
+    i: int,
+    w: float,
+    h: float,
+    font: FontConfig,
+    with_rects: bool,
+    figure_complexity: int,
+    img_cfg: ImageConfig,
+    use_forms: bool,
+):
+    margin = 15 * mm
+    x0, y0 = margin, h - margin
+
+    variant = i % FIGURE_VARIANTS if figure_complexity > 0 else 0
+    if use_forms:
+        name = f"page_{w:.2f}x{h:.2f}_{variant}"
+        if not c.hasForm(name):
+            c.beginForm(name)
+            draw_page_template(c, w, h, font, figure_complexity, variant, img_cfg.seed)
+            c.endForm()
+        c.doForm(name)
+    else:
+        draw_page_template(c, w, h, font, figure_complexity, variant, img_cfg.seed)
+
+    _set_font(c, font.name, font.title_size)
+    c.drawString(x0, y0, f"Stress Test PDF — Page {i}")
+
+    # Sine-ish polyline, emitted as a single stroked path
+    phase_bucket = int(i * 0.01 / (2 * math.pi / SINE_PHASES)) % SINE_PHASES
+    c.addLiteral(_sine_code(*_chart_box(w, h), phase_bucket))
 
     # Optional: sprinkle rectangles to increase object count (can slow generation/viewing)
     if with_rects:
-        if img_cfg.fast:
-            rects = _rects_for_size(w, h, img_cfg.seed)
-            for rx, ry, rw, rh in rects:
-                c.rect(rx, ry, rw, rh, stroke=1, fill=0)
-        else:
-            rng = random.Random(i)  # deterministic per page
-            n_rects = 80
-            for _ in range(n_rects):
-                rw = rng.uniform(5, 40) * mm
-                rh = rng.uniform(3, 25) * mm
-                rx = rng.uniform(margin, max(margin, w - margin - rw))
-                ry = rng.uniform(margin, max(margin, h - margin - rh))
-                c.rect(rx, ry, rw, rh, stroke=1, fill=0)
+        layout = 0 if img_cfg.fast else i % RECT_LAYOUTS
+        c.addLiteral(_rects_for_size(w, h, img_cfg.seed, layout))
 
     # Heavy raster images
     if img_cfg.enabled and img_cfg.per_page > 0:
-        rng = random.Random(img_cfg.seed + i * 7919)
+        # One PCG64 generator per page, with every draw taken in bulk.
+        rng = np.random.default_rng((_np_seed(img_cfg.seed), i))
+        variants = rng.integers(0, img_cfg.variants, img_cfg.per_page).tolist()
+        scales = rng.uniform(0.35, 0.7, img_cfg.per_page).tolist()
+        fx, fy = rng.random((2, img_cfg.per_page)).tolist()
         positions = (
             _image_positions(w, h, img_cfg.per_page, img_cfg.seed)
             if img_cfg.fast
             else None
         )
-        for idx in range(img_cfg.per_page):
-            variant = rng.randrange(max(1, img_cfg.variants))
-            img = _make_image_reader(img_cfg.px, variant, img_cfg.seed)
+        for idx, variant in enumerate(variants):
+            img = _make_image_reader(
+                img_cfg.px, variant, img_cfg.seed, img_cfg.cache_dir
+            )
             iw, ih = img.getSize()
             if positions is not None:
                 x, y, draw_w, draw_h = positions[idx]
@@ -319,15 +507,88 @@ def draw_page(
             else:
                 max_w = w - 2 * margin
                 max_h = h - 2 * margin
-                scale = rng.uniform(0.35, 0.7)
-                draw_w = min(max_w, max_w * scale)
+                draw_w = min(max_w, max_w * scales[idx])
                 draw_h = draw_w * (ih / iw)
                 if draw_h > max_h * 0.8:
                     draw_h = max_h * 0.8
                     draw_w = draw_h * (iw / ih)
-                x = rng.uniform(margin, max(margin, w - margin - draw_w))
-                y = rng.uniform(margin + 20, max(margin + 20, h - margin - draw_h))
-            c.drawImage(img, x, y, draw_w, draw_h, mask=None, preserveAspectRatio=True)
+                x = margin + fx[idx] * max(0, w - 2 * margin - draw_w)
+                y = margin + 20 + fy[idx] * max(0, h - 2 * margin - 20 - draw_h)
+            draw_image_variant(c, img_cfg, variant, x, y, draw_w, draw_h)
+
+
+def render_pages(
+    output: str,
+    first: int,
+    last: int,
+    args: argparse.Namespace,
+    font: FontConfig,
+    img_cfg: ImageConfig,
+    progress: bool = False,
+):
+    _set_compress_level(args.compress_level)
+
+    # Start with an initial page size; we'll change it per page if requested.
+    w, h = page_size_for(first, args.vary_sizes)
+    c = canvas.Canvas(
+        output, pagesize=(w, h), pageCompression=1 if args.compress_level else 0
+    )
+
+    for i in range(first, last + 1):
+        w, h = page_size_for(i, args.vary_sizes)
+        c.setPageSize((w, h))
+        draw_page(
+            c,
+            i,
+            w,
+            h,
+            font,
+            args.with_rects,
+            args.figure_complexity,
+            img_cfg,
+            use_forms=not args.no_forms,
+        )
+        c.showPage()
+
+        # Progress every 500 pages
+        if progress and i % 500 == 0:
+            print(f"Generated {i}/{args.pages} pages...")
+
+    c.save()
+    return last - first + 1
+
+
+def _render_chunk(job):
+    return render_pages(*job)
+
+
+def render_parallel(
+    args: argparse.Namespace, font: FontConfig, img_cfg: ImageConfig, jobs: int
+):
+    # Each worker renders a contiguous page range into its own PDF; pikepdf
+    # then concatenates them without re-encoding any streams. Images are
+    # embedded once per chunk rather than once per document.
+    import pikepdf
+
+    out_dir = os.path.dirname(os.path.abspath(args.output))
+    with tempfile.TemporaryDirectory(dir=out_dir) as tmp:
+        bounds = [args.pages * k // jobs for k in range(jobs + 1)]
+        chunks = [
+            (os.path.join(tmp, f"chunk{k}.pdf"), lo + 1, hi, args, font, img_cfg)
+            for k, (lo, hi) in enumerate(zip(bounds, bounds[1:]))
+        ]
+
+        with multiprocessing.Pool(jobs) as pool:
+            done = 0
+            for n in pool.imap(_render_chunk, chunks):
+                done += n
+                print(f"Generated {done}/{args.pages} pages...")
+
+        with ExitStack() as stack, pikepdf.Pdf.new() as out:
+            for chunk in chunks:
+                part = stack.enter_context(pikepdf.Pdf.open(chunk[0]))
+                out.pages.extend(part.pages)
+            out.save(args.output)
 
 
 def main():
@@ -368,6 +629,12 @@ def main():
         default=3,
         help="Number of distinct image variants reused across pages (default: 3)",
     )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate images instead of reusing the on-disk cache "
+        "($XDG_CACHE_HOME/lektra-bigpdf, default ~/.cache/lektra-bigpdf)",
+    )
     ap.add_argument(
         "--figure-complexity",
         type=int,
@@ -379,6 +646,20 @@ def main():
         action="store_true",
         help="Favor faster generation by reusing cached figures/placements",
     )
+    ap.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        help="zlib level for page streams, 0 disables compression "
+        "(default: 1, or 0 with --fast)",
+    )
+    ap.add_argument(
+        "--no-forms",
+        action="store_true",
+        help="Draw the static page content inline on every page instead of "
+        "sharing it through Form XObjects",
+    )
     ap.add_argument(
         "--vary-sizes",
         action="store_true",
@@ -387,8 +668,18 @@ def main():
     ap.add_argument(
         "--seed", type=int, default=0, help="Seed for any randomness (default: 0)"
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render page ranges in N worker processes and merge them "
+        "(requires pikepdf, default: 1)",
+    )
     args = ap.parse_args()
 
+    if args.compress_level is None:
+        args.compress_level = 0 if args.fast else 1
+
     random.seed(args.seed)
 
     img_cfg = ImageConfig(
@@ -398,38 +689,26 @@ def main():
         variants=max(1, args.image_variants),
         seed=args.seed,
         fast=args.fast,
+        cache_dir=None if args.no_cache else _default_cache_dir(),
     )
 
     if img_cfg.enabled:
         _require_pillow()
 
-    # Start with an initial page size; we'll change it per page if requested.
-    w, h = page_size_for(1, args.vary_sizes)
-    c = canvas.Canvas(
-        args.output, pagesize=(w, h), pageCompression=0 if args.fast else 1
+    font = FontConfig(
+        name=args.font,
+        title_size=args.font_size + 4,
+        body_size=args.font_size,
+        caption_size=max(6, args.font_size - 2),
     )
 
-    for i in range(1, args.pages + 1):
-        w, h = page_size_for(i, args.vary_sizes)
-        c.setPageSize((w, h))
-        draw_page(
-            c,
-            i,
-            w,
-            h,
-            args.font,
-            args.font_size,
-            args.with_rects,
-            args.figure_complexity,
-            img_cfg,
-        )
-        c.showPage()
+    jobs = max(1, min(args.jobs, args.pages))
+    if jobs == 1:
+        render_pages(args.output, 1, args.pages, args, font, img_cfg, progress=True)
+    else:
+        _require_pikepdf()
+        render_parallel(args, font, img_cfg, jobs)
 
-        # Progress every 500 pages
-        if i % 500 == 0:
-            print(f"Generated {i}/{args.pages} pages...")
-
-    c.save()
     print(f"Done: wrote {args.pages} pages to {args.output}")
 
 